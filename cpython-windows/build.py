@@ -5,6 +5,7 @@
 
 import argparse
 import concurrent.futures
+import functools
 import io
 import json
 import multiprocessing
@@ -16,6 +17,7 @@ import subprocess
 import sys
 import tempfile
 import zipfile
+from typing import NamedTuple
 
 from pythonbuild.cpython import (
     STDLIB_TEST_PACKAGES,
@@ -43,6 +45,33 @@ SUPPORT = ROOT / "cpython-windows"
 LOG_PREFIX = [None]
 LOG_FH = [None]
 
+
+class DependencyVersions(NamedTuple):
+    """Versions of dependencies we reference when hacking up project files."""
+
+    bzip2_version: str
+    mpdecimal_version: str
+    nasm_version: str
+    sqlite_version: str
+    sqlite_actual_version: str
+    tcltk_commit: str
+    xz_version: str
+    zlib_version: str
+
+
+# Resolved once so a missing DOWNLOADS entry is caught at startup instead of
+# mid-build.
+DEPS = DependencyVersions(
+    bzip2_version=DOWNLOADS["bzip2"]["version"],
+    mpdecimal_version=DOWNLOADS["mpdecimal"]["version"],
+    nasm_version=DOWNLOADS["nasm-windows-bin"]["version"],
+    sqlite_version=DOWNLOADS["sqlite"]["version"],
+    sqlite_actual_version=DOWNLOADS["sqlite"]["actual_version"],
+    tcltk_commit=DOWNLOADS["tk-windows-bin"]["git_commit"],
+    xz_version=DOWNLOADS["xz"]["version"],
+    zlib_version=DOWNLOADS["zlib"]["version"],
+)
+
 # Extensions that need to be converted from standalone to built-in.
 # Key is name of VS project representing the standalone extension.
 # Value is dict describing the extension.
@@ -186,7 +215,26 @@ def log(msg):
 
     if LOG_FH[0]:
         LOG_FH[0].write(msg_bytes + b"\n")
-        LOG_FH[0].flush()
+
+
+def log_output(lines):
+    """Log lines of raw process output.
+
+    Unlike log(), lines are never decoded: the bytes are written to stdout and
+    the log file as-is. Callers must flush sys.stdout before switching from
+    print() to this function so output is not reordered.
+    """
+    prefix = str(LOG_PREFIX[0]).encode("utf-8")
+    data = memoryview(b"".join(b"%s> %s\n" % (prefix, l) for l in lines))
+
+    # With PYTHONUNBUFFERED, sys.stdout.buffer is a raw stream whose writes may
+    # be partial (console writes are capped at ~32 KiB). Write until all of the
+    # data is out.
+    while data:
+        data = data[sys.stdout.buffer.write(data) :]
+
+    if LOG_FH[0]:
+        LOG_FH[0].writelines(l + b"\n" for l in lines)
 
 
 def exec_and_log(args, cwd, env, exit_on_error=True):
@@ -196,22 +244,46 @@ def exec_and_log(args, cwd, env, exit_on_error=True):
         args,
         cwd=cwd,
         env=env,
-        bufsize=1,
+        # Drain the pipe in large reads; build tools are chatty.
+        bufsize=131072,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )
 
-    for line in iter(p.stdout.readline, b""):
-        log(line.rstrip())
+    sys.stdout.flush()
+
+    # Log whatever output is available as a batch of lines rather than one
+    # line at a time. Reads without a newline are collected and only joined
+    # once a line completes, so very long lines aren't re-copied on every read.
+    pending = []
+    while chunk := p.stdout.read1(131072):
+        pending.append(chunk)
+
+        if b"\n" not in chunk:
+            continue
+
+        lines = b"".join(pending).split(b"\n")
+        tail = lines.pop()
+        pending = [tail] if tail else []
+        log_output([l.rstrip() for l in lines])
+
+    if pending:
+        log_output([b"".join(pending).rstrip()])
 
     p.wait()
 
     log("process exited %d" % p.returncode)
 
+    # The log file is buffered. Flush at process boundaries so it doesn't lag
+    # too far behind the build.
+    if LOG_FH[0]:
+        LOG_FH[0].flush()
+
     if p.returncode and exit_on_error:
         sys.exit(p.returncode)
 
 
+@functools.cache
 def find_vswhere():
     vswhere = (
         pathlib.Path(os.environ["ProgramFiles(x86)"])
@@ -227,8 +299,31 @@ def find_vswhere():
     return vswhere
 
 
-def find_vs_path(path, msvc_version):
+@functools.cache
+def find_vs_install_path(msvc_version):
+    """Find the installation directory of a Visual Studio version.
+
+    The result is cached so vswhere.exe runs at most once per version. It is
+    also persisted in the build directory across invocations, keyed on the
+    modification time of vswhere.exe so a Visual Studio update invalidates it.
+    """
     vswhere = find_vswhere()
+    vswhere_mtime = vswhere.stat().st_mtime_ns
+    cache_path = BUILD / ".vswhere_cache.json"
+
+    try:
+        with cache_path.open("r", encoding="utf8") as fh:
+            cache = json.load(fh)
+    except (FileNotFoundError, ValueError):
+        cache = {}
+
+    cached = cache.get(msvc_version)
+    if (
+        cached
+        and cached["vswhere_mtime"] == vswhere_mtime
+        and os.path.exists(cached["path"])
+    ):
+        return pathlib.Path(cached["path"])
 
     if msvc_version == "2019":
         version = "[16,17)"
@@ -253,7 +348,17 @@ def find_vs_path(path, msvc_version):
 
     p = pathlib.Path(p.strip().decode("utf-8"))
 
-    p = p / path
+    cache[msvc_version] = {"path": str(p), "vswhere_mtime": vswhere_mtime}
+    tmp_path = cache_path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf8") as fh:
+        json.dump(cache, fh, sort_keys=True, indent=4)
+    os.replace(tmp_path, cache_path)
+
+    return p
+
+
+def find_vs_path(path, msvc_version):
+    p = find_vs_install_path(msvc_version) / path
 
     if not p.exists():
         print("%s does not exist" % p)
@@ -284,20 +389,30 @@ def static_replace_in_file(p: pathlib.Path, search, replace):
 
     The updated file contents are written out in place.
     """
+    static_replace_many_in_file(p, [(search, replace)])
+
+
+def static_replace_many_in_file(p: pathlib.Path, replacements):
+    """Apply multiple (search, replace) string replacements to a file.
+
+    The file is read and written at most once. If any search string is
+    missing, nothing is written.
+    """
 
-    with p.open("rb") as fh:
-        data = fh.read()
+    data = p.read_bytes()
+    original = data
 
-    # Build should be as deterministic as possible. Assert that wanted changes
-    # actually occur.
-    if search not in data:
-        raise NoSearchStringError("search string (%s) not in %s" % (search, p))
+    for search, replace in replacements:
+        # Build should be as deterministic as possible. Assert that wanted
+        # changes actually occur.
+        if search not in data:
+            raise NoSearchStringError("search string (%s) not in %s" % (search, p))
 
-    log("replacing `%s` with `%s` in %s" % (search, replace, p))
-    data = data.replace(search, replace)
+        log("replacing `%s` with `%s` in %s" % (search, replace, p))
+        data = data.replace(search, replace)
 
-    with p.open("wb") as fh:
-        fh.write(data)
+    if data != original:
+        p.write_bytes(data)
 
 
 OPENSSL_PROPS_REMOVE_RULES_LEGACY = b"""
@@ -341,76 +456,77 @@ LIBFFI_PROPS_REMOVE_RULES = b"""
 """
 
 
+# Dependency directory properties in python.props that hack_props() rewrites.
+RE_PYTHON_PROPS_DIR = re.compile(
+    rb"<(bz2Dir|libffiOutDir|lzmaDir|mpdecimalDir|opensslIncludeDir|opensslOutDir"
+    rb"|sqlite3Dir|zlibDir)\b[^\r\n]*?</\1>"
+)
+
+
 def hack_props(
     td: pathlib.Path,
     pcbuild_path: pathlib.Path,
     arch: str,
+    python_version: str,
 ):
     # TODO can we pass props into msbuild.exe?
 
     # Our dependencies are in different directories from what CPython's
     # build system expects. Modify the config file appropriately.
 
-    bzip2_version = DOWNLOADS["bzip2"]["version"]
-    sqlite_version = DOWNLOADS["sqlite"]["version"]
-    xz_version = DOWNLOADS["xz"]["version"]
-    zlib_version = DOWNLOADS["zlib"]["version"]
-    tcltk_commit = DOWNLOADS["tk-windows-bin"]["git_commit"]
-    mpdecimal_version = DOWNLOADS["mpdecimal"]["version"]
-
-    sqlite_path = td / ("sqlite-autoconf-%s" % sqlite_version)
-    bzip2_path = td / ("bzip2-%s" % bzip2_version)
+    sqlite_path = td / ("sqlite-autoconf-%s" % DEPS.sqlite_version)
+    bzip2_path = td / ("bzip2-%s" % DEPS.bzip2_version)
     libffi_path = td / "libffi"
-    tcltk_path = td / ("cpython-bin-deps-%s" % tcltk_commit)
-    xz_path = td / ("xz-%s" % xz_version)
-    zlib_path = td / ("zlib-%s" % zlib_version)
-    mpdecimal_path = td / ("mpdecimal-%s" % mpdecimal_version)
+    tcltk_path = td / ("cpython-bin-deps-%s" % DEPS.tcltk_commit)
+    xz_path = td / ("xz-%s" % DEPS.xz_version)
+    zlib_path = td / ("zlib-%s" % DEPS.zlib_version)
+    mpdecimal_path = td / ("mpdecimal-%s" % DEPS.mpdecimal_version)
 
     openssl_root = td / "openssl" / arch
     openssl_libs_path = openssl_root / "lib"
     openssl_include_path = openssl_root / "include"
 
     python_props_path = pcbuild_path / "python.props"
-    lines = []
-
-    with python_props_path.open("rb") as fh:
-        for line in fh:
-            line = line.rstrip()
-
-            # The syntax of these lines changed in 3.10+. 3.10 backport commit
-            # 3139ea33ed84190e079d6ff4859baccdad778dae. Once we drop support for
-            # Python 3.9 we can pass these via properties instead of editing the
-            # properties file.
-            if b"<bz2Dir" in line:
-                line = b"<bz2Dir>%s\\</bz2Dir>" % bzip2_path
 
-            elif b"<libffiOutDir" in line:
-                line = b"<libffiOutDir>%s\\</libffiOutDir>" % libffi_path
-
-            elif b"<lzmaDir" in line:
-                line = b"<lzmaDir>%s\\</lzmaDir>" % xz_path
+    # The syntax of these lines changed in 3.10+. 3.10 backport commit
+    # 3139ea33ed84190e079d6ff4859baccdad778dae. Once we drop support for
+    # Python 3.9 we can pass these via properties instead of editing the
+    # properties file.
+    props_dirs = {
+        b"bz2Dir": b"%s\\" % bzip2_path,
+        b"libffiOutDir": b"%s\\" % libffi_path,
+        b"lzmaDir": b"%s\\" % xz_path,
+        b"opensslIncludeDir": b"%s" % openssl_include_path,
+        b"opensslOutDir": b"%s\\" % openssl_libs_path,
+        b"sqlite3Dir": b"%s\\" % sqlite_path,
+        b"zlibDir": b"%s\\" % zlib_path,
+    }
 
-            elif b"<opensslIncludeDir" in line:
-                line = (
-                    b"<opensslIncludeDir>%s</opensslIncludeDir>" % openssl_include_path
-                )
+    # Only 3.13+ builds against an external mpdecimal.
+    if meets_python_minimum_version(python_version, "3.13"):
+        props_dirs[b"mpdecimalDir"] = b"%s\\" % mpdecimal_path
 
-            elif b"<opensslOutDir" in line:
-                line = b"<opensslOutDir>%s\\</opensslOutDir>" % openssl_libs_path
+    seen = set()
 
-            elif b"<sqlite3Dir" in line:
-                line = b"<sqlite3Dir>%s\\</sqlite3Dir>" % sqlite_path
+    def replace_dir(m):
+        if m[1] not in props_dirs:
+            return m[0]
 
-            elif b"<zlibDir" in line:
-                line = b"<zlibDir>%s\\</zlibDir>" % zlib_path
+        seen.add(m[1])
+        return b"<%s>%s</%s>" % (m[1], props_dirs[m[1]], m[1])
 
-            elif b"<mpdecimalDir" in line:
-                line = b"<mpdecimalDir>%s\\</mpdecimalDir>" % mpdecimal_path
+    data = RE_PYTHON_PROPS_DIR.sub(replace_dir, python_props_path.read_bytes())
 
-            lines.append(line)
+    # Build should be as deterministic as possible. Assert that every
+    # directory was actually rewritten.
+    missing = props_dirs.keys() - seen
+    if missing:
+        raise NoSearchStringError(
+            "%s not in %s"
+            % (", ".join(sorted(t.decode("ascii") for t in missing)), python_props_path)
+        )
 
-    with python_props_path.open("wb") as fh:
-        fh.write(b"\n".join(lines))
+    python_props_path.write_bytes(data)
 
     tcltkprops_path = pcbuild_path / "tcltk.props"
 
@@ -459,15 +575,18 @@ def hack_props(
 
     # Always use libffi-8 / 3.4.2. (Python < 3.11 use libffi-7 by default.)
     try:
-        static_replace_in_file(
-            libffi_props,
-            rb"""<_LIBFFIDLL Include="$(libffiOutDir)\libffi-7.dll" />""",
-            rb"""<_LIBFFIDLL Include="$(libffiOutDir)\libffi-8.dll" />""",
-        )
-        static_replace_in_file(
+        static_replace_many_in_file(
             libffi_props,
-            rb"<AdditionalDependencies>libffi-7.lib;%(AdditionalDependencies)</AdditionalDependencies>",
-            rb"<AdditionalDependencies>libffi-8.lib;%(AdditionalDependencies)</AdditionalDependencies>",
+            [
+                (
+                    rb"""<_LIBFFIDLL Include="$(libffiOutDir)\libffi-7.dll" />""",
+                    rb"""<_LIBFFIDLL Include="$(libffiOutDir)\libffi-8.dll" />""",
+                ),
+                (
+                    rb"<AdditionalDependencies>libffi-7.lib;%(AdditionalDependencies)</AdditionalDependencies>",
+                    rb"<AdditionalDependencies>libffi-8.lib;%(AdditionalDependencies)</AdditionalDependencies>",
+                ),
+            ],
         )
     except NoSearchStringError:
         pass
@@ -487,42 +606,46 @@ def hack_project_files(
         td,
         pcbuild_path,
         build_directory,
+        python_version,
     )
 
     # Our SQLite directory is named weirdly. This throws off version detection
     # in the project file. Replace the parsing logic with a static string.
-    sqlite3_version = DOWNLOADS["sqlite"]["actual_version"].encode("ascii")
+    sqlite3_version = DEPS.sqlite_actual_version.encode("ascii")
     sqlite3_version_parts = sqlite3_version.split(b".")
     sqlite3_path = pcbuild_path / "sqlite3.vcxproj"
-    static_replace_in_file(
+    static_replace_many_in_file(
         sqlite3_path,
-        rb"<_SqliteVersion>$([System.Text.RegularExpressions.Regex]::Match(`$(sqlite3Dir)`, `((\d+)\.(\d+)\.(\d+)\.(\d+))\\?$`).Groups)</_SqliteVersion>",
-        rb"<_SqliteVersion>%s</_SqliteVersion>" % sqlite3_version,
-    )
-    static_replace_in_file(
-        sqlite3_path,
-        rb"<SqliteVersion>$(_SqliteVersion.Split(`;`)[1])</SqliteVersion>",
-        rb"<SqliteVersion>%s</SqliteVersion>" % sqlite3_version,
-    )
-    static_replace_in_file(
-        sqlite3_path,
-        rb"<SqliteMajorVersion>$(_SqliteVersion.Split(`;`)[2])</SqliteMajorVersion>",
-        rb"<SqliteMajorVersion>%s</SqliteMajorVersion>" % sqlite3_version_parts[0],
-    )
-    static_replace_in_file(
-        sqlite3_path,
-        rb"<SqliteMinorVersion>$(_SqliteVersion.Split(`;`)[3])</SqliteMinorVersion>",
-        rb"<SqliteMinorVersion>%s</SqliteMinorVersion>" % sqlite3_version_parts[1],
-    )
-    static_replace_in_file(
-        sqlite3_path,
-        rb"<SqliteMicroVersion>$(_SqliteVersion.Split(`;`)[4])</SqliteMicroVersion>",
-        rb"<SqliteMicroVersion>%s</SqliteMicroVersion>" % sqlite3_version_parts[2],
-    )
-    static_replace_in_file(
-        sqlite3_path,
-        rb"<SqlitePatchVersion>$(_SqliteVersion.Split(`;`)[5])</SqlitePatchVersion>",
-        rb"<SqlitePatchVersion>%s</SqlitePatchVersion>" % sqlite3_version_parts[3],
+        [
+            (
+                rb"<_SqliteVersion>$([System.Text.RegularExpressions.Regex]::Match(`$(sqlite3Dir)`, `((\d+)\.(\d+)\.(\d+)\.(\d+))\\?$`).Groups)</_SqliteVersion>",
+                rb"<_SqliteVersion>%s</_SqliteVersion>" % sqlite3_version,
+            ),
+            (
+                rb"<SqliteVersion>$(_SqliteVersion.Split(`;`)[1])</SqliteVersion>",
+                rb"<SqliteVersion>%s</SqliteVersion>" % sqlite3_version,
+            ),
+            (
+                rb"<SqliteMajorVersion>$(_SqliteVersion.Split(`;`)[2])</SqliteMajorVersion>",
+                rb"<SqliteMajorVersion>%s</SqliteMajorVersion>"
+                % sqlite3_version_parts[0],
+            ),
+            (
+                rb"<SqliteMinorVersion>$(_SqliteVersion.Split(`;`)[3])</SqliteMinorVersion>",
+                rb"<SqliteMinorVersion>%s</SqliteMinorVersion>"
+                % sqlite3_version_parts[1],
+            ),
+            (
+                rb"<SqliteMicroVersion>$(_SqliteVersion.Split(`;`)[4])</SqliteMicroVersion>",
+                rb"<SqliteMicroVersion>%s</SqliteMicroVersion>"
+                % sqlite3_version_parts[2],
+            ),
+            (
+                rb"<SqlitePatchVersion>$(_SqliteVersion.Split(`;`)[5])</SqlitePatchVersion>",
+                rb"<SqlitePatchVersion>%s</SqlitePatchVersion>"
+                % sqlite3_version_parts[3],
+            ),
+        ],
     )
 
     # Our version of the xz sources is newer than what's in cpython-source-deps
@@ -532,16 +655,18 @@ def hack_project_files(
     # ... but CPython finally upgraded liblzma in 2022, so newer CPython releases
     # already have this patch. So we're phasing it out.
     try:
-        liblzma_path = pcbuild_path / "liblzma.vcxproj"
-        static_replace_in_file(
-            liblzma_path,
-            rb"$(lzmaDir)windows;$(lzmaDir)src/liblzma/common;",
-            rb"$(lzmaDir)windows\vs2019;$(lzmaDir)src/liblzma/common;",
-        )
-        static_replace_in_file(
-            liblzma_path,
-            rb'<ClInclude Include="$(lzmaDir)windows\config.h" />',
-            rb'<ClInclude Include="$(lzmaDir)windows\vs2019\config.h" />',
+        static_replace_many_in_file(
+            pcbuild_path / "liblzma.vcxproj",
+            [
+                (
+                    rb"$(lzmaDir)windows;$(lzmaDir)src/liblzma/common;",
+                    rb"$(lzmaDir)windows\vs2019;$(lzmaDir)src/liblzma/common;",
+                ),
+                (
+                    rb'<ClInclude Include="$(lzmaDir)windows\config.h" />',
+                    rb'<ClInclude Include="$(lzmaDir)windows\vs2019\config.h" />',
+                ),
+            ],
         )
     except NoSearchStringError:
         pass
@@ -582,18 +707,16 @@ def hack_project_files(
 
     pcbuild_proj = pcbuild_path / "pcbuild.proj"
 
-    static_replace_in_file(
+    static_replace_many_in_file(
         pcbuild_proj,
-        b'<Projects2 Include="python_uwp.vcxproj;pythonw_uwp.vcxproj" Condition="$(IncludeUwp)" />',
-        b"",
-    )
-    static_replace_in_file(
-        pcbuild_proj,
-        b'<Projects Include="pylauncher.vcxproj;pywlauncher.vcxproj" />',
-        b"",
-    )
-    static_replace_in_file(
-        pcbuild_proj, b'<Projects Include="pyshellext.vcxproj" />', b""
+        [
+            (
+                b'<Projects2 Include="python_uwp.vcxproj;pythonw_uwp.vcxproj" Condition="$(IncludeUwp)" />',
+                b"",
+            ),
+            (b'<Projects Include="pylauncher.vcxproj;pywlauncher.vcxproj" />', b""),
+            (b'<Projects Include="pyshellext.vcxproj" />', b""),
+        ],
     )
 
     # Ditto for freeze_importlib, which isn't needed since we don't modify
@@ -660,8 +783,6 @@ def build_openssl_for_arch(
     *,
     jom_archive,
 ):
-    nasm_version = DOWNLOADS["nasm-windows-bin"]["version"]
-
     log("extracting %s to %s" % (openssl_archive, build_root))
     extract_tar_to_directory(openssl_archive, build_root)
     log("extracting %s to %s" % (nasm_archive, build_root))
@@ -669,7 +790,7 @@ def build_openssl_for_arch(
     log("extracting %s to %s" % (jom_archive, build_root))
     extract_zip_to_directory(jom_archive, build_root / "jom")
 
-    nasm_path = build_root / ("cpython-bin-deps-nasm-%s" % nasm_version)
+    nasm_path = build_root / ("cpython-bin-deps-nasm-%s" % DEPS.nasm_version)
     jom_path = build_root / "jom"
 
     env = dict(os.environ)
@@ -744,6 +865,32 @@ def build_openssl_for_arch(
         shutil.copyfile(source, dest)
 
 
+# Bump when build_openssl_for_arch() changes how OpenSSL is configured, patched
+# or built, so previously built archives are not reused.
+OPENSSL_BUILD_RECIPE_VERSION = 1
+
+
+def openssl_build_key(entry: str, arch: str, msvc_version: str) -> str:
+    """Describe the inputs of an OpenSSL build.
+
+    The download digests pin the exact sources and tools used. Together with
+    the recipe version and Visual Studio version, a change to any of them
+    invalidates a previously built archive.
+    """
+    return "\n".join(
+        [entry, arch, msvc_version, str(OPENSSL_BUILD_RECIPE_VERSION)]
+        + [
+            DOWNLOADS[name]["sha256"]
+            for name in (
+                entry,
+                "nasm-windows-bin",
+                "jom-windows-bin",
+                "strawberryperl",
+            )
+        ]
+    )
+
+
 def build_openssl(
     entry: str,
     perl_path: pathlib.Path,
@@ -815,19 +962,21 @@ def build_libffi(
 
         # As of April 15, 2020, the libffi source release on GitHub doesn't
         # have patches that we need to build. https://bugs.python.org/issue40293
-        # tracks getting a proper release. Until then, git clone the repo.
+        # tracks getting a proper release. Until then, fetch the commit we want
+        # from the repo. A shallow fetch of just that commit avoids downloading
+        # the branch's history.
+        subprocess.run(["git.exe", "init", str(ffi_source_path)], check=True)
+
         subprocess.run(
             [
                 "git.exe",
-                "-c",
-                "core.autocrlf=input",
-                "clone",
-                "--single-branch",
-                "--branch",
-                "libffi",
+                "fetch",
+                "--depth",
+                "1",
                 "https://github.com/python/cpython-source-deps.git",
-                str(ffi_source_path),
+                "16fad4855b3d8c03b5910e405ff3a04395b39a98",
             ],
+            cwd=ffi_source_path,
             check=True,
         )
 
@@ -837,7 +986,7 @@ def build_libffi(
                 "-c",
                 "core.autocrlf=input",
                 "checkout",
-                "16fad4855b3d8c03b5910e405ff3a04395b39a98",
+                "FETCH_HEAD",
             ],
             cwd=ffi_source_path,
             check=True,
@@ -887,7 +1036,7 @@ def build_libffi(
 
 
 RE_ADDITIONAL_DEPENDENCIES = re.compile(
-    "<AdditionalDependencies>([^<]+)</AdditionalDependencies>"
+    rb"<AdditionalDependencies>([^<\r\n]+)</AdditionalDependencies>"
 )
 
 
@@ -963,7 +1112,7 @@ def collect_python_build_artifacts(
     # Projects that provide extensions.
     extension_projects = set()
 
-    dirs = {p for p in os.listdir(intermediates_path)}
+    dirs = set(os.listdir(intermediates_path))
 
     for extension, entry in CONVERT_TO_BUILTIN_EXTENSIONS.items():
         if extension not in dirs:
@@ -993,36 +1142,36 @@ def collect_python_build_artifacts(
         )
         sys.exit(1)
 
-    res = {"core": {"objs": []}, "extensions": {}}
+    res = {"core": {}, "extensions": {}}
 
     res["object_file_format"] = "coff"
 
-    def process_project(project: pathlib.Path, dest_dir: pathlib.Path):
-        for f in sorted(os.listdir(intermediates_path / project)):
-            p = intermediates_path / project / f
-            dest = dest_dir / p.name
+    def process_project(project: str, dest_dir: pathlib.Path):
+        project_path = intermediates_path / project
 
-            if p.suffix == ".obj":
-                log("copying object file %s to %s" % (p, dest_dir))
-                shutil.copyfile(p, dest)
-                yield f
+        # Filter on the directory entry names so non-object files never
+        # become Path instances.
+        with os.scandir(project_path) as it:
+            objs = sorted(e.name for e in it if e.name.endswith(".obj"))
+
+        for f in objs:
+            p = project_path / f
+            log("copying object file %s to %s" % (p, dest_dir))
+            shutil.copyfile(p, dest_dir / f)
+            yield f
 
     def find_additional_dependencies(project: pathlib.Path):
         vcproj = pcbuild_path / ("%s.vcxproj" % project)
 
-        with vcproj.open("r", encoding="utf8") as fh:
-            for line in fh:
-                m = RE_ADDITIONAL_DEPENDENCIES.search(line)
-
-                if not m:
-                    continue
+        m = RE_ADDITIONAL_DEPENDENCIES.search(vcproj.read_bytes())
 
-                depends = set(m.group(1).split(";"))
-                depends.discard("%(AdditionalDependencies)")
+        if not m:
+            return set()
 
-                return depends
+        depends = set(m.group(1).decode("utf-8").split(";"))
+        depends.discard("%(AdditionalDependencies)")
 
-        return set()
+        return depends
 
     if arch == "amd64":
         abi_platform = "win_amd64"
@@ -1042,8 +1191,9 @@ def collect_python_build_artifacts(
     core_dir = out_dir / "build" / "core"
     core_dir.mkdir(parents=True)
 
-    for obj in process_project("pythoncore", core_dir):
-        res["core"]["objs"].append("build/core/%s" % obj)
+    res["core"]["objs"] = [
+        "build/core/%s" % obj for obj in process_project("pythoncore", core_dir)
+    ]
 
     # Copy config.c into output directory, next to its object file.
     shutil.copyfile(
@@ -1086,16 +1236,21 @@ def collect_python_build_artifacts(
         dest_dir = out_dir / "build" / "extensions" / ext
         dest_dir.mkdir(parents=True)
 
+        ext_entry = CONVERT_TO_BUILTIN_EXTENSIONS.get(ext, {})
+
         additional_depends = find_additional_dependencies(ext)
-        additional_depends -= CONVERT_TO_BUILTIN_EXTENSIONS.get(ext, {}).get(
-            "ignore_additional_depends", set()
-        )
+        additional_depends -= ext_entry.get("ignore_additional_depends", set())
+
+        objs = [
+            "build/extensions/%s/%s" % (ext, obj)
+            for obj in process_project(ext, dest_dir)
+        ]
 
         entry = {
             "in_core": False,
-            "objs": [],
+            "objs": objs,
             "init_fn": "PyInit_%s" % ext,
-            "shared_lib": None,
+            "shared_lib": "install/DLLs/%s%s.pyd" % (ext, abi_tag),
             "static_lib": None,
             "links": [
                 {"name": n[:-4], "system": True} for n in sorted(additional_depends)
@@ -1103,17 +1258,12 @@ def collect_python_build_artifacts(
             "variant": "default",
         }
 
-        for obj in process_project(ext, dest_dir):
-            entry["objs"].append("build/extensions/%s/%s" % (ext, obj))
-
-        for lib in CONVERT_TO_BUILTIN_EXTENSIONS.get(ext, {}).get("shared_depends", []):
+        for lib in ext_entry.get("shared_depends", []):
             entry["links"].append(
                 {"name": lib, "path_dynamic": "install/DLLs/%s.dll" % lib}
             )
 
-        for lib in CONVERT_TO_BUILTIN_EXTENSIONS.get(ext, {}).get(
-            "shared_depends_%s" % arch, []
-        ):
+        for lib in ext_entry.get("shared_depends_%s" % arch, []):
             entry["links"].append(
                 {"name": lib, "path_dynamic": "install/DLLs/%s.dll" % lib}
             )
@@ -1148,11 +1298,6 @@ def collect_python_build_artifacts(
         log("copying static extension %s" % ext_static)
         shutil.copyfile(ext_static, dest)
 
-        res["extensions"][ext][0]["shared_lib"] = "install/DLLs/%s%s.pyd" % (
-            ext,
-            abi_tag,
-        )
-
     lib_dir = out_dir / "build" / "lib"
     lib_dir.mkdir()
 
@@ -1194,29 +1339,45 @@ def build_cpython(
     # The python.props file keys off MSBUILD, so it needs to be set.
     os.environ["MSBUILD"] = str(msbuild)
 
-    bzip2_archive = download_entry("bzip2", BUILD)
-    sqlite_archive = download_entry("sqlite", BUILD)
-    tk_bin_archive = download_entry(
-        "tk-windows-bin", BUILD, local_name="tk-windows-bin.tar.gz"
-    )
-    xz_archive = download_entry("xz", BUILD)
-    zlib_archive = download_entry("zlib", BUILD)
-
-    python_archive = download_entry(python_entry_name, BUILD)
     entry = DOWNLOADS[python_entry_name]
-
     python_version = entry["version"]
 
-    setuptools_wheel = download_entry("setuptools", BUILD)
-    pip_wheel = download_entry("pip", BUILD)
+    # Map of DOWNLOADS entry to download_entry() keyword arguments.
+    downloads = {
+        "bzip2": {},
+        "sqlite": {},
+        "tk-windows-bin": {"local_name": "tk-windows-bin.tar.gz"},
+        "xz": {},
+        "zlib": {},
+        python_entry_name: {},
+        "setuptools": {},
+        "pip": {},
+    }
 
     # CPython 3.13+ no longer uses a bundled `mpdecimal` version so we build it
+    # TODO: Consider using the built mpdecimal for earlier versions as well,
+    # as we do for Unix builds.
     if meets_python_minimum_version(python_version, "3.13"):
-        mpdecimal_archive = download_entry("mpdecimal", BUILD)
-    else:
-        # TODO: Consider using the built mpdecimal for earlier versions as well,
-        # as we do for Unix builds.
-        mpdecimal_archive = None
+        downloads["mpdecimal"] = {}
+
+    # Downloads are independent and network bound, so fetch them concurrently.
+    with concurrent.futures.ThreadPoolExecutor(len(downloads)) as e:
+        fs = {
+            name: e.submit(download_entry, name, BUILD, **kwargs)
+            for name, kwargs in downloads.items()
+        }
+
+    downloaded = {name: f.result() for name, f in fs.items()}
+
+    bzip2_archive = downloaded["bzip2"]
+    sqlite_archive = downloaded["sqlite"]
+    tk_bin_archive = downloaded["tk-windows-bin"]
+    xz_archive = downloaded["xz"]
+    zlib_archive = downloaded["zlib"]
+    python_archive = downloaded[python_entry_name]
+    setuptools_wheel = downloaded["setuptools"]
+    pip_wheel = downloaded["pip"]
+    mpdecimal_archive = downloaded.get("mpdecimal")
 
     if freethreaded:
         (major, minor, _) = python_version.split(".")
@@ -1241,29 +1402,37 @@ def build_cpython(
     with tempfile.TemporaryDirectory(prefix="python-build-", **tempdir_opts) as td:
         td = pathlib.Path(td)
 
-        with concurrent.futures.ThreadPoolExecutor(10) as e:
-            fs = []
+        # All archives extract into distinct top-level directories.
+        archives = [
+            a
             for a in (
                 python_archive,
                 bzip2_archive,
+                libffi_archive,
                 mpdecimal_archive,
                 openssl_archive,
                 sqlite_archive,
                 tk_bin_archive,
                 xz_archive,
                 zlib_archive,
-            ):
-                if a is None:
-                    continue
+            )
+            if a is not None
+        ]
 
+        # tarfile is mostly pure Python and would serialize on the GIL, so
+        # extract archives in separate processes.
+        with concurrent.futures.ProcessPoolExecutor(
+            min(len(archives), multiprocessing.cpu_count())
+        ) as e:
+            fs = [e.submit(extract_tar_to_directory, a, td) for a in archives]
+
+            for a in archives:
                 log("extracting %s to %s" % (a, td))
-                fs.append(e.submit(extract_tar_to_directory, a, td))
 
+            # Surface the first extraction failure, if any.
             for f in fs:
                 f.result()
 
-        extract_tar_to_directory(libffi_archive, td)
-
         # We need all the OpenSSL library files in the same directory to appease
         # install rules.
         openssl_arch = {"amd64": "amd64", "x86": "win32"}[arch]
@@ -1291,10 +1460,7 @@ def build_cpython(
         # Parse config.c before we hack it up: we want a pristine copy.
         config_c_path = cpython_source_path / "PC" / "config.c"
 
-        with config_c_path.open("r", encoding="utf8") as fh:
-            config_c = fh.read()
-
-        builtin_extensions = parse_config_c(config_c)
+        builtin_extensions = parse_config_c(config_c_path.read_text(encoding="utf8"))
 
         hack_project_files(
             td,
@@ -1652,13 +1818,10 @@ def build_cpython(
 
         data = normalize_tar_archive(data)
 
+        # The normalized archive is already in memory. Write it out in one go
+        # rather than in small chunks.
         with dest_path.open("wb") as fh:
-            while True:
-                chunk = data.read(32768)
-                if not chunk:
-                    break
-
-                fh.write(chunk)
+            fh.write(data.getbuffer())
 
         return dest_path
 
@@ -1667,8 +1830,38 @@ def fetch_strawberry_perl() -> pathlib.Path:
     strawberryperl_zip = download_entry("strawberryperl", BUILD)
     strawberryperl = BUILD / "strawberry-perl"
     strawberryperl.mkdir(exist_ok=True)
+
+    # ZipFile.extract() creates missing parents of the sanitized member path,
+    # and concurrent threads would race to create the same directory. Extract
+    # directory entries and the first file of each directory serially, so
+    # ZipFile itself has created every directory before the remaining files
+    # are extracted in parallel.
+    files = []
+    seen_dirs = set()
     with zipfile.ZipFile(strawberryperl_zip) as zf:
-        zf.extractall(strawberryperl)
+        for i in zf.infolist():
+            parent = os.path.dirname(i.filename)
+
+            if i.is_dir() or parent not in seen_dirs:
+                zf.extract(i, strawberryperl)
+                if not i.is_dir():
+                    seen_dirs.add(parent)
+            else:
+                files.append(i)
+
+    # The archive holds thousands of files. zlib releases the GIL while
+    # inflating, so extract with multiple threads. ZipFile instances can't be
+    # shared between threads, so each opens its own.
+    def extract(members):
+        with zipfile.ZipFile(strawberryperl_zip) as zf:
+            for m in members:
+                zf.extract(m, strawberryperl)
+
+    workers = multiprocessing.cpu_count()
+    with concurrent.futures.ThreadPoolExecutor(workers) as e:
+        for f in [e.submit(extract, files[i::workers]) for i in range(workers)]:
+            f.result()
+
     return strawberryperl
 
 
@@ -1715,7 +1908,7 @@ def main() -> None:
 
     log_path = BUILD / "build.log"
 
-    with log_path.open("wb") as log_fh:
+    with log_path.open("wb", buffering=1 << 20) as log_fh:
         LOG_FH[0] = log_fh
 
         if os.environ.get("Platform") == "x86":
@@ -1738,7 +1931,13 @@ def main() -> None:
         openssl_archive = BUILD / (
             "%s-%s-%s.tar" % (openssl_entry, target_triple, build_options)
         )
-        if not openssl_archive.exists():
+        openssl_key_path = openssl_archive.with_name(openssl_archive.name + ".key")
+        openssl_key = openssl_build_key(openssl_entry, arch, args.vs)
+        if (
+            not openssl_archive.exists()
+            or not openssl_key_path.exists()
+            or openssl_key_path.read_text(encoding="utf8") != openssl_key
+        ):
             perl_path = fetch_strawberry_perl() / "perl" / "bin" / "perl.exe"
             LOG_PREFIX[0] = "openssl"
             build_openssl(
@@ -1747,6 +1946,9 @@ def main() -> None:
                 arch,
                 dest_archive=openssl_archive,
             )
+            openssl_key_path.write_text(openssl_key, encoding="utf8")
+        else:
+            log("reusing %s" % openssl_archive)
 
         libffi_archive = BUILD / ("libffi-%s-%s.tar" % (target_triple, build_options))
         if not libffi_archive.exists():
@@ -223,6 +223,11 @@ def meets_python_maximum_version(got: str, wanted: str) -> bool:
     return (got_major, got_minor) <= (wanted_major, wanted_minor)
 
 
+RE_VARIABLE = re.compile(rb"^[a-zA-Z_]+\s*=")
+RE_EXTENSION_MODULE = re.compile(rb"^([a-z_]+)\s.*[a-zA-Z/_-]+\.c\b")
+RE_DEFINE = re.compile(rb"-D[^=]+=[^\s]+")
+
+
 def derive_setup_local(
     cpython_source_archive,
     python_version,
@@ -305,9 +310,6 @@ def derive_setup_local(
     setup_enabled_lines = {}
     section = "static"
 
-    RE_VARIABLE = re.compile(rb"^[a-zA-Z_]+\s*=")
-    RE_EXTENSION_MODULE = re.compile(rb"^([a-z_]+)\s.*[a-zA-Z/_-]+\.c\b")
-
     # Setup.bootstrap.in has a simple format.
     for line in setup_bootstrap_in:
         if b"#" in line:
@@ -419,8 +421,6 @@ def derive_setup_local(
     # agrees fully with the distribution's knowledge of extensions. So we can
     # treat our metadata as canonical.
 
-    RE_DEFINE = re.compile(rb"-D[^=]+=[^\s]+")
-
     # Translate our YAML metadata into Setup lines.
 
     section_lines = {
@@ -628,7 +628,7 @@ def derive_setup_local(
     }
 
 
-RE_INITTAB_ENTRY = re.compile('\{"([^"]+)", ([^\}]+)\},')
+RE_INITTAB_ENTRY = re.compile(r'\{"([^"]+)", ([^\}]+)\},')
 
 
 def parse_config_c(s: str):
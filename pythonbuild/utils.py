@@ -324,7 +324,12 @@ def download_entry(key: str, dest_path: pathlib.Path, local_name=None) -> pathli
 
 
 def create_tar_from_directory(fh, base_path: pathlib.Path, path_prefix=None):
-    with tarfile.open(name="", mode="w", fileobj=fh) as tf:
+    # Archives are written sequentially, so use stream mode with a large
+    # buffer to coalesce writes to ``fh``. Member data is also copied in large
+    # chunks instead of tarfile's 16 KiB default.
+    with tarfile.open(  # type: ignore[call-arg]
+        name="", mode="w|", fileobj=fh, bufsize=1048576, copybufsize=1048576
+    ) as tf:
         for root, dirs, files in os.walk(base_path):
             dirs.sort()
 
@@ -337,7 +342,8 @@ def create_tar_from_directory(fh, base_path: pathlib.Path, path_prefix=None):
 
 
 def extract_tar_to_directory(source: pathlib.Path, dest: pathlib.Path):
-    with tarfile.open(source, "r") as tf:
+    # Copy member data out in 1 MiB chunks instead of tarfile's 16 KiB default.
+    with tarfile.open(source, "r", copybufsize=1048576) as tf:  # type: ignore[call-arg]
         tf.extractall(dest)
 
 
@@ -411,7 +417,7 @@ def normalize_tar_archive(data: io.BytesIO) -> io.BytesIO:
             ti.mode |= stat.S_IXGRP
 
     dest = io.BytesIO()
-    with tarfile.open(fileobj=dest, mode="w") as tf:
+    with tarfile.TarFile(fileobj=dest, mode="w", copybufsize=1048576) as tf:
         for ti, filedata in members:
             tf.addfile(ti, filedata)
 
@@ -545,7 +551,8 @@ def exec_and_log(args, cwd, env):
         args,
         cwd=cwd,
         env=env,
-        bufsize=1,
+        # Drain the pipe in large reads; build tools are chatty.
+        bufsize=131072,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )